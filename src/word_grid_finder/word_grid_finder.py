@@ -1,9 +1,17 @@
+import bisect
+import functools
 import math
+import os
+import pickle
 import re
 import shutil
 
 from abc import abstractmethod
-from dataclasses import dataclass, field
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import chain, repeat
+from operator import methodcaller
 from dykes import parse_args, StoreTrue
 from dykes.options import Flags, NArgs
 from pathlib import Path
@@ -12,6 +20,27 @@ from textual.containers import Horizontal, VerticalScroll
 from textual.widgets import Footer, Header, Input, TextArea, Button, Checkbox, Label
 from typing import Annotated
 
+try:  # Optional accelerator - vectorized scans when pyarrow is installed
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+try:  # Optional accelerator - single-pass multi-substring search
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:  # Optional accelerator - vectorized output formatting
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # Optional accelerator - JIT-compiled scan over a packed byte buffer
+    import numba
+except ImportError:
+    numba = None
+
 
 SOWPODS = Path(Path(__file__).parent, "data/sowpods.txt")
 
@@ -103,7 +132,14 @@ class Options(VerticalScroll):
         self.text_box = text_box
         self._args = args
         self._wordlist = wordlist
+        # Sorted copies (forward and reversed) answer startswith/endswith via
+        # binary search instead of a full scan on every refresh
+        self._sorted_words = sorted(wordlist)
+        self._sorted_reversed = sorted(word[::-1] for word in wordlist)
+        self._by_len = build_len_index(wordlist)
         self._tests = list()
+        self._last_tests: list[Test] = []
+        self._last_result: list[str] | None = None
         width, _ = shutil.get_terminal_size((120, 40))
         self._width = math.floor(width * 0.65) - 2
         self._test_string = ""
@@ -162,9 +198,75 @@ class Options(VerticalScroll):
         self.refresh_words()
 
     def update_valid_words(self):
-        self.text_box.text = format_output(
-            get_valid_words(False, self._tests, self._wordlist), self._width
-        )
+        valid = self._cached_result()
+        if valid is None:
+            candidates, tests = self._seed_candidates()
+            # The length index only describes the full word list, not a
+            # seeded set
+            by_len = self._by_len if candidates is self._wordlist else None
+            valid = get_valid_words(False, tests, candidates, by_len=by_len)
+        self._last_tests = list(self._tests)
+        self._last_result = valid
+        self.text_box.text = format_output(valid, self._width)
+
+    def _cached_result(self) -> list[str] | None:
+        """Reuse the previous scan when the tests did not change or narrowed.
+
+        Identical tests hand back the previous result outright. When the new
+        tests are a superset of the previous ones - the user typed one more
+        constraint - only the added tests run, and over the previous (much
+        smaller) result instead of the full word list. Anything else rescans.
+        """
+        if self._last_result is None:
+            return None
+        previous = {repr(test) for test in self._last_tests}
+        current = {repr(test) for test in self._tests}
+        if current == previous:
+            return self._last_result
+        if current > previous:
+            added = [test for test in self._tests if repr(test) not in previous]
+            return get_valid_words(False, added, self._last_result)
+        return None
+
+    def _seed_candidates(self) -> tuple[list[str], list["Test"]]:
+        """Narrow the candidate words with the sorted prefix/suffix indexes.
+
+        A startswith (or endswith, on the reversed index) test is answered in
+        O(log n + matches) so the remaining tests only scan the narrowed set.
+        Falls back to the full word list when neither test is active.
+        """
+        for test in self._tests:
+            if isinstance(test, StartsWith):
+                remaining = [t for t in self._tests if t is not test]
+                prefixes = (
+                    test.substring
+                    if isinstance(test.substring, tuple)
+                    else (test.substring,)
+                )
+                candidates = list(
+                    chain.from_iterable(
+                        _prefix_range(self._sorted_words, prefix)
+                        for prefix in prefixes
+                    )
+                )
+                return candidates, remaining
+        for test in self._tests:
+            if isinstance(test, EndsWith):
+                remaining = [t for t in self._tests if t is not test]
+                suffixes = (
+                    test.substring
+                    if isinstance(test.substring, tuple)
+                    else (test.substring,)
+                )
+                candidates = [
+                    word[::-1]
+                    for word in chain.from_iterable(
+                        _prefix_range(self._sorted_reversed, suffix[::-1])
+                        for suffix in suffixes
+                    )
+                ]
+                return candidates, remaining
+        return self._wordlist, self._tests
 
     def get_tests(self):
         """Convert the options into Tests"""
@@ -217,7 +319,7 @@ class Options(VerticalScroll):
             else:
                 test_string_components.append(f"Is at most {max_len} letters long")
         self._test_string = join_with_and(test_string_components)
-        self._tests = tests
+        self._tests = order_tests(merge_prefix_tests(tests))
 
 
 class WordGridTui(App):
@@ -275,58 +377,222 @@ class WordGridTui(App):
 class Test:
     """Base class for checks"""
 
+    __slots__ = ()  # Keep subclasses free of a per-instance __dict__
+
+    COST = 5  # Relative per-word cost, used to order the pipeline
+
+    @property
+    def cost(self) -> int:
+        return self.COST
+
     @abstractmethod
     def check(self, word: str) -> bool:
         """Abstract check method"""
         pass
 
+    def arrow_mask(self, words):
+        """Boolean mask over an Arrow array or None if the test needs the Python path"""
+        return None
 
-@dataclass
-class Contains(Test):
-    """Check for words that contain a substring"""
+    def as_predicate(self):
+        """A specialized per-word predicate with the test's state bound in"""
+        return self.check
+
+    def encoded(self) -> "Test":
+        """A copy of the test that checks bytes words instead of str"""
+        return self
+
+
+@dataclass(slots=True)
+class _Substring(Test):
+    """Base for tests built around a needle (or, for prefix/suffix, several)"""
 
-    substring: str  # The substring to check for
-    starts: bool = False  # If the substring needs to be at the start of the word
-    ends: bool = False  # If the substring needs to be at the end of the word
-    multiple: bool = False  # If the substring needs to appear multiple times
-    does_not: bool = False  # If the word cannot include the substring
+    substring: str | tuple[str, ...]  # The substring(s) to check for
+    _first: str | bytes | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self):
+        if isinstance(self.substring, tuple):
+            self.substring = tuple(needle.strip() for needle in self.substring)
+            return
         self.substring = self.substring.strip()
+        # First-character probe: a single-char membership test is a straight
+        # memchr, so a miss rejects the word before the pricier multi-char
+        # search runs. Pointless for single-char needles, where it is the
+        # same scan
+        self._first = self.substring[:1] if len(self.substring) >= 2 else None
+
+    def encoded(self) -> "_Substring":
+        if isinstance(self.substring, tuple):
+            encoded = tuple(needle.encode("ascii") for needle in self.substring)
+            return replace(self, substring=encoded)
+        return replace(self, substring=self.substring.encode("ascii"))
+
+
+@dataclass(slots=True)
+class StartsWith(_Substring):
+    """Check for words that start with the substring (any of, for a tuple)"""
+
+    COST = 1
 
     def check(self, word: str) -> bool:
-        if self.starts:
-            return word.startswith(self.substring)
-        if self.ends:
-            return word.endswith(self.substring)
-        if self.multiple:
-            return word.count(self.substring) > 1
-        if self.does_not:
-            return self.substring not in word
-        return self.substring.strip() in word
+        # str.startswith walks a tuple of prefixes in a single C call
+        return word.startswith(self.substring)
 
+    def as_predicate(self):
+        return methodcaller("startswith", self.substring)
 
-@dataclass
+    def arrow_mask(self, words):
+        if isinstance(self.substring, tuple):
+            return functools.reduce(
+                pc.or_, (pc.starts_with(words, needle) for needle in self.substring)
+            )
+        return pc.starts_with(words, self.substring)
+
+
+@dataclass(slots=True)
+class EndsWith(_Substring):
+    """Check for words that end with the substring (any of, for a tuple)"""
+
+    COST = 1
+
+    def check(self, word: str) -> bool:
+        return word.endswith(self.substring)
+
+    def as_predicate(self):
+        return methodcaller("endswith", self.substring)
+
+    def arrow_mask(self, words):
+        if isinstance(self.substring, tuple):
+            return functools.reduce(
+                pc.or_, (pc.ends_with(words, needle) for needle in self.substring)
+            )
+        return pc.ends_with(words, self.substring)
+
+
+@dataclass(slots=True)
+class In(_Substring):
+    """Check for words that contain the substring"""
+
+    COST = 3
+
+    def check(self, word: str) -> bool:
+        if self._first is not None and self._first not in word:
+            return False
+        return self.substring in word
+
+    def as_predicate(self):
+        substring = self.substring
+        if (first := self._first) is None:
+            return methodcaller("__contains__", substring)
+        return lambda word: first in word and substring in word
+
+    def arrow_mask(self, words):
+        return pc.match_substring(words, self.substring)
+
+
+@dataclass(slots=True)
+class NotIn(_Substring):
+    """Check for words that do not contain the substring"""
+
+    COST = 3
+
+    def check(self, word: str) -> bool:
+        return self.substring not in word
+
+    def as_predicate(self):
+        substring = self.substring
+        return lambda word: substring not in word
+
+    def arrow_mask(self, words):
+        return pc.invert(pc.match_substring(words, self.substring))
+
+
+@dataclass(slots=True)
+class MultipleOf(_Substring):
+    """Check for words that contain the substring more than once"""
+
+    COST = 4
+
+    def check(self, word: str) -> bool:
+        if self._first is not None and self._first not in word:
+            return False
+        return word.count(self.substring) > 1
+
+    def as_predicate(self):
+        substring = self.substring
+        if (first := self._first) is None:
+            return lambda word: word.count(substring) > 1
+        return lambda word: first in word and word.count(substring) > 1
+
+    def arrow_mask(self, words):
+        return pc.greater(pc.count_substring(words, self.substring), 1)
+
+
+def Contains(
+    substring: str,
+    starts: bool = False,
+    ends: bool = False,
+    multiple: bool = False,
+    does_not: bool = False,
+) -> _Substring:
+    """Build the specialized substring test for the requested flavor.
+
+    Kept with the historical constructor signature; each flavor is its own
+    class so check() is a single straight-line body instead of a four-way
+    branch cascade evaluated on every word.
+    """
+    if starts:
+        return StartsWith(substring)
+    if ends:
+        return EndsWith(substring)
+    if multiple:
+        return MultipleOf(substring)
+    if does_not:
+        return NotIn(substring)
+    return In(substring)
+
+
+@dataclass(slots=True)
 class Length(Test):
     """Check based on the length of the word"""
 
     min_len: int
     max_len: int
 
+    COST = 0  # A len() compare, the cheapest reject there is
+
     def check(self, word: str) -> bool:
         if self.min_len == self.max_len:
             return len(word) == self.min_len
         return self.min_len <= len(word) <= self.max_len
 
+    def as_predicate(self):
+        min_len, max_len = self.min_len, self.max_len
+        if min_len == max_len:
+            return lambda word: len(word) == min_len
+        return lambda word: min_len <= len(word) <= max_len
 
-@dataclass
+    def arrow_mask(self, words):
+        if pa.types.is_binary(words.type):
+            lengths = pc.binary_length(words)
+        else:
+            lengths = pc.utf8_length(words)
+        return pc.and_(
+            pc.greater_equal(lengths, self.min_len),
+            pc.less_equal(lengths, self.max_len),
+        )
+
+
+@dataclass(slots=True)
 class Double(Test):
     """Check for double letters"""
 
-    def check(self, word: str) -> bool:
-        import re  # Import here for lazy import since we only need re here.
+    COST = 6  # Walks the whole word character by character
 
-        return bool(re.search(r"([a-z])\1", word))
+    def check(self, word: str) -> bool:
+        return any(a == b for a, b in zip(word, word[1:]))
 
 
 def handle_args() -> tuple[list[Test], Path, bool, CLIArgs]:
@@ -351,34 +617,125 @@ def handle_args() -> tuple[list[Test], Path, bool, CLIArgs]:
         tests.extend(
             Contains(substring, does_not=True) for substring in args.not_contain
         )
-    return tests, args.word_list, args.reversed, args
+    return order_tests(merge_prefix_tests(tests)), args.word_list, args.reversed, args
+
+
+# Below this many words the one-off numpy setup costs more than it saves
+_NUMPY_FORMAT_MIN = 1_000
+
+
+def _numpy_columns(
+    wordlist: list[str], longest: int, line_len: int, separator: str
+) -> str:
+    """Column layout as one vectorized pad plus a fixed-width reshape.
+
+    np.char.rjust pads every word to the same width in a single C pass, and
+    because the padded dtype is exactly that width, viewing each full row as
+    one wider fixed-width string concatenates the line without any per-word
+    formatting calls.
+    """
+    cols = max(line_len // longest, 1)
+    padded = np.char.rjust(np.asarray(wordlist, dtype=str), longest)
+    full = len(wordlist) // cols * cols
+    lines = []
+    if full:
+        rows = padded[:full].reshape(-1, cols).view(f"U{cols * longest}").ravel()
+        lines = [line + separator for line in rows.tolist()]
+    return "".join(lines) + "".join(padded[full:].tolist())
 
 
 def format_output(wordlist: list[str], line_len: int = 120, separator: str = "\n"):
     """Format the output to columns"""
     if not wordlist:
         return ""
-    output = ""
-    curr_line = ""
     longest = max(map(len, wordlist)) + 2
+    if np is not None and len(wordlist) >= _NUMPY_FORMAT_MIN:
+        return _numpy_columns(wordlist, longest, line_len, separator)
+    # Collect pieces and join once at the end; building the output with
+    # str += copies the whole accumulated string on every append
+    parts = []
+    curr = []
+    curr_len = 0  # Every column is exactly longest wide
     for word in wordlist:
-        curr_line += f"{word:>{longest}}"
-        if len(curr_line) + longest > line_len:
-            output += curr_line + separator
-            curr_line = ""
-    return output + curr_line
+        curr.append(f"{word:>{longest}}")
+        curr_len += longest
+        if curr_len + longest > line_len:
+            parts.append("".join(curr))
+            parts.append(separator)
+            curr.clear()
+            curr_len = 0
+    parts.append("".join(curr))
+    return "".join(parts)
+
+
+def load_word_list(path: Path) -> list[bytes]:
+    """Load the word list, keeping a pre-split cache next to the source file.
+
+    Parsing the SOWPODS text re-splits a couple of MB into ~270k objects on
+    every invocation before any filtering starts. A pickle of the split list
+    loads in a single pass, so it is kept beside the text file and rebuilt
+    whenever the text is newer. Cache reads and writes fail soft - a stale or
+    unreadable pickle (or a read-only install) just falls back to parsing the
+    text.
+    """
+    cache = path.with_suffix(".pkl")
+    try:
+        if cache.stat().st_mtime >= path.stat().st_mtime:
+            cached = pickle.loads(cache.read_bytes())
+            # A truncated or foreign pickle can raise nearly anything (or
+            # deserialize to the wrong shape); this is a pure cache, so any
+            # surprise just means rebuilding it from the text
+            if isinstance(cached, list):
+                return cached
+    except Exception:
+        pass
+    word_list = path.read_bytes().splitlines()
+    try:
+        cache.write_bytes(pickle.dumps(word_list, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return word_list
+
+
+def _decode_words(word_list: list[bytes]) -> list[str]:
+    """Decode a bytes word list, tolerating non-ASCII custom word lists"""
+    return [word.decode("utf-8") for word in word_list]
 
 
 def main() -> int:
     """Main function"""
     tests, wordlist, reverse_output, args = handle_args()
-    if not (word_list := wordlist.read_text().splitlines()):
+    if not (word_list := load_word_list(wordlist)):
         raise RuntimeError(f"Failed to read word list from {wordlist=}")
     if not tests:
         raise RuntimeError("You didn't specify any constraints!")
     if args.tui:
-        return run_tui(args, word_list)
-    valid_words = get_valid_words(reverse_output, tests, word_list)
+        return run_tui(args, _decode_words(word_list))
+    # SOWPODS is pure ASCII, so the CLI filters the raw bytes: every check
+    # stays on CPython's memcmp/memchr fast paths (no unicode kind dispatch)
+    # and only the surviving words get decoded. A custom word list or needle
+    # with non-ASCII characters keeps the str pipeline, where lengths and
+    # double letters mean characters rather than bytes
+    try:
+        encoded_tests = [test.encoded() for test in tests]
+        bytes_path = all(word.isascii() for word in word_list)
+    except UnicodeEncodeError:
+        bytes_path = False
+    if bytes_path:
+        valid_words = [
+            word.decode("ascii")
+            for word in get_valid_words(
+                reverse_output,
+                encoded_tests,
+                word_list,
+                by_len=build_len_index(word_list),
+            )
+        ]
+    else:
+        words = _decode_words(word_list)
+        valid_words = get_valid_words(
+            reverse_output, tests, words, by_len=build_len_index(words)
+        )
     width, _ = shutil.get_terminal_size(
         (120, 40)
     )  # Get the right width for the screen to maaximize output
@@ -386,23 +743,423 @@ def main() -> int:
     return 0
 
 
-def get_valid_words(
-    reversed: bool, tests: list[Test], word_list: list[str]
-) -> list[str]:
-    return sorted(
-        (word for word in word_list if all(test.check(word) for test in tests)),
-        key=lambda x: (len(x), x),
-        reverse=reversed,
+def merge_prefix_tests(tests: list["Test"]) -> list["Test"]:
+    """Batch the prefix tests (and the suffix tests) into one tuple needle.
+
+    str.startswith/endswith walk a tuple of needles in a single C call, so K
+    prefix tests collapse into one per-word call matching any of the prefixes
+    instead of K Python-level dispatches. With a single prefix the test is
+    left alone.
+    """
+    merged = []
+    for cls in (StartsWith, EndsWith):
+        group = [test for test in tests if type(test) is cls]
+        if len(group) > 1:
+            needles = tuple(dict.fromkeys(test.substring for test in group))
+            merged.append(cls(needles if len(needles) > 1 else needles[0]))
+            tests = [test for test in tests if type(test) is not cls]
+    return tests + merged
+
+
+def order_tests(tests: list["Test"]) -> list["Test"]:
+    """Order the tests cheapest-and-most-selective first.
+
+    all(...) short-circuits, so running a cheap selective test (Length, a
+    prefix check) before an expensive one (occurrence counting, the double
+    scan) decides most words without ever paying for the expensive test.
+    """
+    return sorted(tests, key=lambda test: test.cost)
+
+
+def compile_tests(tests: list["Test"]):
+    """Compile the tests into a single per-word predicate.
+
+    Each test binds its state into a closure once, so the inner loop pays a
+    plain call per test instead of a method lookup plus attribute/flag loads,
+    and the whole pipeline short-circuits in one function call per word.
+    """
+    predicates = [test.as_predicate() for test in tests]
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def check_all(word) -> bool:
+        for predicate in predicates:
+            if not predicate(word):
+                return False
+        return True
+
+    return check_all
+
+
+def build_len_index(word_list: list[str]) -> dict[int, list[str]]:
+    """Index the word list by word length"""
+    by_len = defaultdict(list)
+    for word in word_list:
+        by_len[len(word)].append(word)
+    return by_len
+
+
+def _length_candidates(
+    tests: list["Test"], word_list: list[str], by_len: dict[int, list[str]]
+) -> tuple[list[str], list["Test"]]:
+    """Restrict the candidates to the length buckets a Length test allows.
+
+    The length index is built once at load time, so pulling the Length test
+    out of the pipeline and chaining its buckets skips every word the test
+    would have rejected - on SOWPODS a tight min/max cuts the candidate set
+    several-fold before any other predicate runs.
+    """
+    for test in tests:
+        if isinstance(test, Length):
+            remaining = [t for t in tests if t is not test]
+            candidates = list(
+                chain.from_iterable(
+                    words
+                    for length, words in by_len.items()
+                    if test.min_len <= length <= test.max_len
+                )
+            )
+            return candidates, remaining
+    return word_list, tests
+
+
+# The scan is embarrassingly parallel over words, but worker startup and
+# pickling are not free - only fan out when there is real work to split
+_PARALLEL_MIN_WORDS = 50_000
+_PARALLEL_MIN_TESTS = 3
+
+
+def _filter_chunk(chunk: list, tests: list["Test"]) -> list:
+    """Filter one chunk of the word list (runs in a worker process)"""
+    return list(filter(compile_tests(tests), chunk))
+
+
+def _parallel_filter(tests: list["Test"], word_list: list) -> list | None:
+    """Fan the filter pass out across processes.
+
+    Words are split into one chunk per core and filtered independently; the
+    tests are plain dataclasses so they pickle to the workers cheaply, and the
+    final sort still runs in the parent. Returns None on a single-core box so
+    the caller keeps the in-process path.
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1:
+        return None
+    chunk_size = math.ceil(len(word_list) / workers)
+    chunks = [
+        word_list[start : start + chunk_size]
+        for start in range(0, len(word_list), chunk_size)
+    ]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        return list(
+            chain.from_iterable(executor.map(_filter_chunk, chunks, repeat(tests)))
+        )
+
+
+def _prefix_range(sorted_words: list[str], prefix: str) -> list[str]:
+    """All words in a sorted list that start with prefix, via binary search"""
+    lo = bisect.bisect_left(sorted_words, prefix)
+    hi = bisect.bisect_left(sorted_words, prefix + "\U0010ffff", lo)
+    return sorted_words[lo:hi]
+
+
+def _ahocorasick_check(tests: list[Test]):
+    """Collapse the substring Contains tests into one Aho-Corasick pass.
+
+    With several needles active each word would otherwise be scanned once per
+    needle; a single automaton classifies the word against every needle in one
+    linear pass. Returns (check, remaining) where check answers all the folded
+    tests at once, or (None, tests) when pyahocorasick is missing or there are
+    not enough needles to be worth the automaton build.
+    """
+    plain = set()
+    not_ = set()
+    multiple = set()
+    remaining = []
+    for test in tests:
+        # automaton.add_word("") silently drops empty needles, so a
+        # stripped-to-empty test must keep its native check()
+        if not isinstance(test, (In, NotIn, MultipleOf)) or not test.substring:
+            remaining.append(test)
+        elif isinstance(test, NotIn):
+            not_.add(test.substring)
+        elif isinstance(test, MultipleOf):
+            multiple.add(test.substring)
+        else:
+            plain.add(test.substring)
+    if ahocorasick is None or len(plain) + len(not_) + len(multiple) < 2:
+        return None, tests
+    automaton = ahocorasick.Automaton()
+    for needle in plain | not_ | multiple:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+
+    def check(word: str) -> bool:
+        hits = set()
+        counts = {}
+        ends = {}
+        for end, needle in automaton.iter(word):
+            hits.add(needle)
+            if needle in multiple:
+                # Count like str.count: drop hits that overlap the previous
+                # accepted hit of the same needle
+                if end - len(needle) + 1 > ends.get(needle, -1):
+                    ends[needle] = end
+                    counts[needle] = counts.get(needle, 0) + 1
+        return (
+            plain <= hits
+            and not_.isdisjoint(hits)
+            and all(counts.get(needle, 0) > 1 for needle in multiple)
+        )
+
+    return check, remaining
+
+
+_ARROW_CACHE: dict[int, tuple[list[str], "pa.StringArray"]] = {}
+
+
+# Tagged-union kinds for the jitted kernel
+_NB_STARTS, _NB_ENDS, _NB_IN, _NB_NOT_IN, _NB_MULTIPLE, _NB_LENGTH, _NB_DOUBLE = range(
+    7
+)
+_NB_KINDS = {
+    StartsWith: _NB_STARTS,
+    EndsWith: _NB_ENDS,
+    In: _NB_IN,
+    NotIn: _NB_NOT_IN,
+    MultipleOf: _NB_MULTIPLE,
+    Length: _NB_LENGTH,
+    Double: _NB_DOUBLE,
+}
+
+
+def _pack(chunks: list[bytes]):
+    """Pack byte strings into one contiguous buffer plus an offsets array"""
+    buf = np.frombuffer(b"".join(chunks), np.uint8)
+    offsets = np.zeros(len(chunks) + 1, np.int64)
+    np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    return buf, offsets
+
+
+def _numba_descriptors(tests: list["Test"]):
+    """Encode the tests as the tagged union the jitted kernel understands.
+
+    Returns None when a test does not fit the encoding (str needles, tuple
+    needles) so the caller can fall back to the Python pipeline.
+    """
+    kinds = []
+    needles = []
+    mins = []
+    maxs = []
+    for test in tests:
+        kind = _NB_KINDS.get(type(test))
+        if kind is None:
+            return None
+        needle = b""
+        min_len = max_len = 0
+        if isinstance(test, _Substring):
+            if not isinstance(test.substring, bytes):
+                return None
+            needle = test.substring
+        elif isinstance(test, Length):
+            min_len, max_len = test.min_len, test.max_len
+        kinds.append(kind)
+        needles.append(needle)
+        mins.append(min_len)
+        maxs.append(max_len)
+    needle_buf, needle_offsets = _pack(needles)
+    return (
+        np.array(kinds, np.int8),
+        needle_buf,
+        needle_offsets,
+        np.array(mins, np.int64),
+        np.array(maxs, np.int64),
     )
 
 
+def _scan_words(buf, offsets, kinds, needle_buf, needle_offsets, mins, maxs):
+    """Evaluate every test against every packed word in one tight loop.
+
+    Written in the numba nopython subset - plain index arithmetic over uint8
+    arrays - and compiled with @njit when numba is installed; substring search
+    counts non-overlapping hits exactly like bytes.count.
+    """
+    n = offsets.shape[0] - 1
+    out = np.empty(n, np.bool_)
+    for i in range(n):
+        word_start, word_end = offsets[i], offsets[i + 1]
+        word_len = word_end - word_start
+        ok = True
+        for j in range(kinds.shape[0]):
+            kind = kinds[j]
+            if kind == _NB_LENGTH:
+                ok = mins[j] <= word_len <= maxs[j]
+            elif kind == _NB_DOUBLE:
+                ok = False
+                for p in range(word_start, word_end - 1):
+                    if buf[p] == buf[p + 1]:
+                        ok = True
+                        break
+            else:
+                needle_start = needle_offsets[j]
+                needle_len = needle_offsets[j + 1] - needle_start
+                if needle_len == 0:
+                    # The empty needle is everywhere, any number of times
+                    ok = kind != _NB_NOT_IN
+                elif kind == _NB_STARTS or kind == _NB_ENDS:
+                    ok = word_len >= needle_len
+                    if ok:
+                        base = word_start
+                        if kind == _NB_ENDS:
+                            base = word_end - needle_len
+                        for p in range(needle_len):
+                            if buf[base + p] != needle_buf[needle_start + p]:
+                                ok = False
+                                break
+                else:
+                    count = 0
+                    p = word_start
+                    while p <= word_end - needle_len:
+                        hit = True
+                        for q in range(needle_len):
+                            if buf[p + q] != needle_buf[needle_start + q]:
+                                hit = False
+                                break
+                        if hit:
+                            count += 1
+                            if count > 1 or kind != _NB_MULTIPLE:
+                                break
+                            p += needle_len
+                        else:
+                            p += 1
+                    if kind == _NB_NOT_IN:
+                        ok = count == 0
+                    elif kind == _NB_MULTIPLE:
+                        ok = count > 1
+                    else:
+                        ok = count > 0
+            if not ok:
+                break
+        out[i] = ok
+    return out
+
+
+if numba is not None:
+    _scan_words = numba.njit(cache=True)(_scan_words)
+
+
+def _numba_filter(tests: list["Test"], word_list: list[bytes]) -> list[bytes] | None:
+    """Filter a bytes word list with the JIT-compiled kernel.
+
+    Packs the words into one contiguous buffer and runs a single compiled
+    pass over it, so the per-word interpreter dispatch disappears entirely.
+    Returns None when numba is missing or a test cannot be encoded.
+    """
+    if numba is None or not word_list:
+        return None
+    descriptors = _numba_descriptors(tests)
+    if descriptors is None:
+        return None
+    kinds, needle_buf, needle_offsets, mins, maxs = descriptors
+    buf, offsets = _pack(word_list)
+    mask = _scan_words(buf, offsets, kinds, needle_buf, needle_offsets, mins, maxs)
+    return [word for word, keep in zip(word_list, mask) if keep]
+
+
+def _arrow_words(word_list: list[str]) -> "pa.StringArray":
+    """Build (and cache) the Arrow array for a word list.
+
+    Only full-size word lists are cached; the short-lived candidate lists the
+    TUI seeds per refresh are cheap to convert and would pin memory (the cached
+    list is kept alive so its id cannot be recycled for a different list).
+    """
+    type_ = pa.binary() if isinstance(word_list[0], bytes) else pa.string()
+    if len(word_list) < 50_000:
+        return pa.array(word_list, type=type_)
+    entry = _ARROW_CACHE.get(id(word_list))
+    if entry is None or entry[0] is not word_list:
+        entry = _ARROW_CACHE[id(word_list)] = (
+            word_list,
+            pa.array(word_list, type=type_),
+        )
+    return entry[1]
+
+
+def _arrow_filter(tests: list[Test], word_list: list[str]) -> list[str] | None:
+    """Filter the word list with Arrow compute kernels.
+
+    Folds every test that can be expressed as a compute kernel into a single
+    boolean mask so the scan runs in vectorized C instead of a per-word Python
+    loop. Returns None when pyarrow is missing so the caller can fall back.
+    """
+    if pc is None or not word_list:
+        return None
+    masks = []
+    remaining = []
+    words = _arrow_words(word_list)
+    for test in tests:
+        mask = test.arrow_mask(words)
+        if mask is None:
+            remaining.append(test)
+        else:
+            masks.append(mask)
+    if not masks:
+        return None
+    valid = words.filter(functools.reduce(pc.and_, masks)).to_pylist()
+    if remaining:
+        valid = [word for word in valid if all(test.check(word) for test in remaining)]
+    return valid
+
+
+def get_valid_words(
+    reversed: bool,
+    tests: list[Test],
+    word_list: list[str] | list[bytes],
+    by_len: dict[int, list[str]] | None = None,
+) -> list[str] | list[bytes]:
+    valid = _arrow_filter(tests, word_list)
+    if valid is None:
+        if by_len is not None:
+            word_list, tests = _length_candidates(tests, word_list, by_len)
+        if word_list and isinstance(word_list[0], bytes):
+            valid = _numba_filter(tests, word_list)
+    if valid is None:
+        # Cheap rejects (Length/Double/starts/ends) run before the needle scan;
+        # pyahocorasick automatons hold unicode keys, so only str lists qualify
+        if word_list and isinstance(word_list[0], str):
+            needle_check, remaining = _ahocorasick_check(tests)
+        else:
+            needle_check, remaining = None, tests
+        if needle_check is None:
+            valid = None
+            if (
+                len(word_list) > _PARALLEL_MIN_WORDS
+                and len(tests) >= _PARALLEL_MIN_TESTS
+            ):
+                valid = _parallel_filter(tests, word_list)
+            if valid is None:
+                valid = list(filter(compile_tests(tests), word_list))
+        else:
+            check_all = compile_tests(remaining)
+            valid = [
+                word for word in word_list if check_all(word) and needle_check(word)
+            ]
+    # Two stable sorts give the (len, word) order without the key lambda
+    # allocating a tuple per comparison: Timsort keeps the word order within
+    # each length when the cheap len sort runs second
+    valid.sort(reverse=reversed)
+    valid.sort(key=len, reverse=reversed)
+    return valid
+
+
 def run_tui(args: WGFArgs, wordlist: list[str]) -> int:
     WordGridTui(args, wordlist).run()
     return 0
 
 
 def start_tui() -> int:
-    return run_tui(parse_args(WGFArgs), SOWPODS.read_text().splitlines()).run()
+    word_list = _decode_words(load_word_list(SOWPODS))
+    return run_tui(parse_args(WGFArgs), word_list).run()
 
 
 if __name__ == "__main__":